@@ -1,3 +1,5 @@
+import re
+
 RE_SUPREME_CHAPTER = r"(^\d+[.])\s{1,}(.*$)"
 
 RE_CHAPTER = r"(^\d+[.])\s?(\d+[.])\s{1,}(.*$)"
@@ -10,4 +12,79 @@ RE_ANSWER_TEXT = r"\.([\s\S]*?)(\d+\.|$)"
 
 RE_PART_ANSWER = r"\)\s([\s\S]*?)([.|;]\s\d+\)|[.|;]\s[а-яё]\)|[.|;]\s\d+\.|$)"
 
+RE_ANY_ANSWER = r"(\d+)\.([\s\S]*?)(?=\d+\.|$)"
+
+RE_ANY_PART_ANSWER = (r"(?=([а-яё]|\d{1,2})\)\s([\s\S]*?)"
+                      r"(?:[.|;]\s\d+\)|[.|;]\s[а-яё]\)|[.|;]\s\d+\.|$))")
+
+RE_DISPATCH = (fr"(?P<supreme>{RE_SUPREME_CHAPTER})"
+               fr"|(?P<chapter>{RE_CHAPTER})"
+               fr"|(?P<task>{RE_TASK})")
+
 ABSENT = "Отсутствует"
+
+AUTHORS_DATA = ({
+    'name': 'Текстовые задачи по математике. 5–6 классы / ' +
+    'А. В. Шевкин. — 3-е изд., перераб. — М. : '
+    'Илекса, 2024. — 160 с. : ил.',
+    'description': 'Сборник включает текстовые задачи по разделам '
+    'школьной математики: натуральные числа, дроби, пропорции, '
+    'проценты, уравнения. Ко многим задачам даны ответы или советы с '
+    'чего начать решения. Решения некоторых задач приведены в качестве '
+    'образцов в основном тексте книги или в разделе '
+    '«Ответы, советы, решения». '
+    'Материалы сборника можно использовать как '
+    'дополнение к любому действующему '
+    'учебнику. При подготовке этого издания добавлены новые '
+    'задачи и решения некоторых '
+    'задач. Пособие предназначено для учащихся 5–6 классов '
+    'общеобразовательных школ, учителей, '
+    'студентов педагогических вузов.',
+    'topic_id': 1,
+    'classes': '5;6'
+},)
+
+DOCUMENT_XML = "word/document.xml"
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+RUN_TEXT = {
+    f"{W}tab": "\t",
+    f"{W}ptab": "\t",
+    f"{W}cr": "\n",
+    f"{W}noBreakHyphen": "-"
+}
+
+TASKS_DTYPES = {
+    'id_tasks_book': 'string',
+    'task': 'string',
+    'answer': 'string',
+    'classes': 'category',
+    'paragraph': 'int32',
+    'topic_id': 'int16',
+    'level': 'int8'
+}
+
+CHAPTERS_DTYPES = {
+    'id': 'int32',
+    'name': 'string',
+    'parent': 'int32'
+}
+
+TASKS_COLUMNS = list(TASKS_DTYPES)
+
+CHAPTERS_COLUMNS = list(CHAPTERS_DTYPES)
+
+RE_SUPREME_CHAPTER_C = re.compile(RE_SUPREME_CHAPTER)
+
+RE_CHAPTER_C = re.compile(RE_CHAPTER)
+
+RE_TASK_C = re.compile(RE_TASK)
+
+RE_TASK_ID_C = re.compile(RE_TASK_ID)
+
+RE_DISPATCH_C = re.compile(RE_DISPATCH)
+
+RE_ANY_ANSWER_C = re.compile(RE_ANY_ANSWER)
+
+RE_ANY_PART_ANSWER_C = re.compile(RE_ANY_PART_ANSWER)
@@ -10,91 +10,192 @@
 листами для каждого типа данных.
 """
 
-import re
+import zipfile
+from collections import deque
+from itertools import islice
 
 import pandas
-import docx
+from lxml import etree
 
 from constants import (
-    RE_ANSWER_TEXT,
-    RE_CHAPTER,
-    RE_PART_ANSWER,
-    RE_SUPREME_CHAPTER,
-    RE_TASK,
-    RE_TASK_ID,
-    ABSENT
+    RE_ANY_ANSWER_C,
+    RE_ANY_PART_ANSWER_C,
+    RE_CHAPTER_C,
+    RE_DISPATCH_C,
+    RE_SUPREME_CHAPTER_C,
+    RE_TASK_C,
+    RE_TASK_ID_C,
+    ABSENT,
+    AUTHORS_DATA,
+    CHAPTERS_COLUMNS,
+    CHAPTERS_DTYPES,
+    DOCUMENT_XML,
+    RUN_TEXT,
+    TASKS_COLUMNS,
+    TASKS_DTYPES,
+    W
 )
 
 
-def find_next_task(data, tasks_data, next_index, previous_id, paragraph):
-    """Рекурсивно находит следующую задачу в документе.
+def get_run_text(run):
+    """Собирает текст фрагмента (w:r) так же, как python-docx.
 
     Args:
-        data (list): Список текстовых параграфов из документа.
-        tasks_data (list): Список для хранения извлеченных данных о задачах.
-        next_index (int): Текущий индекс в списке данных для начала поиска.
+        run (Element): XML-элемент фрагмента.
+
+    Returns:
+        str: Текст фрагмента.
+    """
+    parts = []
+    for element in run.iterchildren(f'{W}t', f'{W}br', *RUN_TEXT):
+        if element.tag == f'{W}t':
+            parts.append(element.text or '')
+        elif element.tag == f'{W}br':
+            if element.get(f'{W}type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(RUN_TEXT[element.tag])
+    return ''.join(parts)
+
+
+def get_paragraph_text(paragraph):
+    """Собирает текст параграфа (w:p) так же, как python-docx.
+
+    Args:
+        paragraph (Element): XML-элемент параграфа.
+
+    Returns:
+        str: Текст параграфа.
+    """
+    parts = []
+    for element in paragraph.iterchildren(f'{W}r', f'{W}hyperlink'):
+        if element.tag == f'{W}r':
+            parts.append(get_run_text(element))
+        else:
+            parts.extend(get_run_text(run)
+                         for run in element.iterchildren(f'{W}r'))
+    return ''.join(parts)
+
+
+def read_paragraphs(docx_file):
+    """Последовательно выдает текст параграфов документа.
+
+    Читает word/document.xml напрямую через lxml, без построения
+    объектной модели python-docx. Учитываются только параграфы
+    верхнего уровня, как в Document.iter_inner_content.
+
+    Args:
+        docx_file (str | file): Путь к .docx-файлу или открытый файл.
+
+    Yields:
+        str: Текст параграфа без пробелов по краям.
+    """
+    with zipfile.ZipFile(docx_file) as archive, \
+            archive.open(DOCUMENT_XML) as document_xml:
+        for _, paragraph in etree.iterparse(document_xml, tag=f'{W}p'):
+            body = paragraph.getparent()
+            if body.tag != f'{W}body':
+                continue
+            yield get_paragraph_text(paragraph).strip()
+            paragraph.clear()
+            while paragraph.getprevious() is not None:
+                del body[0]
+
+
+def next_paragraph(window, paragraphs):
+    """Сдвигает окно просмотра документа на один параграф.
+
+    Args:
+        window (deque): Окно из текущего и следующего параграфов.
+        paragraphs (iterator): Итератор по оставшимся параграфам.
+    """
+    window.popleft()
+    text = next(paragraphs, None)
+    if text is not None:
+        window.append(text)
+
+
+def find_next_task(window, paragraphs, tasks_data, next_index,
+                   previous_id, paragraph):
+    """Последовательно находит идущие подряд задачи в документе.
+
+    Args:
+        window (deque): Окно из текущего и следующего параграфов.
+        paragraphs (iterator): Итератор по оставшимся параграфам.
+        tasks_data (dict): Столбцы для хранения извлеченных данных о задачах.
+        next_index (int): Индекс текущего параграфа в документе.
         previous_id (str): ID предыдущей задачи для ссылки.
         paragraph (int): ID текущей главы.
 
     Returns:
         int: Индекс следующего элемента после последней найденной задачи.
     """
-    text = data[next_index]
-    task_match = re.search(RE_TASK, text)
-    if task_match:
-        if re.search(RE_SUPREME_CHAPTER, text):
-            return next_index
-        tasks_data.append(get_task_data(task_match, paragraph, previous_id))
-        next_index = find_next_task(data, tasks_data,
-                                    next_index + 1, previous_id, paragraph)
+    while window:
+        text = window[0]
+        if get_paragraph_kind(text) != 'task':
+            break
+        task_match = RE_TASK_C.search(text)
+        append_task(tasks_data, task_match, paragraph, previous_id)
+        next_paragraph(window, paragraphs)
+        next_index += 1
     return next_index
 
 
-def find_next_chapter(data, next_index):
-    """Находит следующую главу в документе.
+def get_paragraph_kind(text):
+    """Определяет тип параграфа за один проход регулярного выражения.
+
+    Шаблоны проверяются в порядке: раздел, глава, задача.
+
+    Args:
+        text (str): Текст параграфа.
+
+    Returns:
+        str: 'supreme', 'chapter', 'task' или None, если ничего не найдено.
+    """
+    dispatch_match = RE_DISPATCH_C.search(text)
+    if dispatch_match:
+        return dispatch_match.lastgroup
+    return None
+
+
+def new_table(columns):
+    """Создает пустую таблицу, хранящую данные по столбцам.
 
     Args:
-        data (list): Список текстовых параграфов из документа.
-        next_index (int): Текущий индекс в списке данных для начала поиска.
+        columns (list): Названия столбцов.
 
     Returns:
-        tuple: (Match-объект с найденной главой, индекс текущего элемента)
+        dict: Словарь {название столбца: список значений}.
     """
-    text = data[next_index]
-    chapter_match = chapter_match = re.search(RE_CHAPTER, text)
-    return chapter_match, next_index
+    return {column: [] for column in columns}
 
 
-def get_chapter_data(id, match, parent=0):
-    """Формирует данные о главе.
+def append_chapter(chapters_data, id, match, parent=0):
+    """Добавляет данные о главе в таблицу глав.
 
     Args:
+        chapters_data (dict): Столбцы с данными о главах.
         id (int): Уникальный идентификатор главы.
         match (Match): Match-объект с найденной главой.
         parent (int, optional): ID родительской главы. По умолчанию 0.
-
-    Returns:
-        dict: Словарь с данными о главе.
     """
+    chapters_data['id'].append(id)
     if not parent:
-        return {
-            'id': id,
-            'name': f'{match.group(1)}{match.group(2)}',
-            'parent': parent
-        }
+        chapters_data['name'].append(f'{match.group(1)}{match.group(2)}')
     else:
-        return {
-            'id': id,
-            'name': f'{match.group(1)}{match.group(2)}{match.group(3)}',
-            'parent': parent
-        }
+        chapters_data['name'].append(
+            f'{match.group(1)}{match.group(2)}{match.group(3)}')
+    chapters_data['parent'].append(parent)
 
 
-def get_task_data(match, paragraph, previous=None,
-                  exclusive=False, classes='5;6', level=1, topic_id=1):
-    """Формирует данные о задаче.
+def append_task(tasks_data, match, paragraph, previous=None,
+                exclusive=False, classes='5;6', level=1, topic_id=1):
+    """Добавляет данные о задаче в таблицу задач.
+
+    Ответ задачи заполняется позже в answer_parser.
 
     Args:
+        tasks_data (dict): Столбцы с данными о задачах.
         match (Match): Match-объект с найденной задачей.
         paragraph (int): ID текущей главы.
         previous (str, optional): ID предыдущей задачи. По умолчанию None.
@@ -104,63 +205,74 @@ def get_task_data(match, paragraph, previous=None,
         задача. По умолчанию '5;6'.
         level (int, optional): Уровень сложности. По умолчанию 1.
         topic_id (int, optional): ID темы. По умолчанию 1.
-
-    Returns:
-        dict: Словарь с данными о задаче.
     """
-    data = {
-        'classes': classes,
-        'paragraph': paragraph,
-        'topic_id': topic_id,
-        'level': level
-    }
     if exclusive:
-        data['id_tasks_book'] = (match.group(1))[:-1]
-        data['task'] = match.group(2)
+        id_tasks_book = (match.group(1))[:-1]
+        task = match.group(2)
     elif match.group(1) is None:
         if not previous.endswith('.'):
             previous = previous + '.'
-        data['id_tasks_book'] = (previous + match.group(4))[:-1]
-        data['task'] = match.group(5)
+        id_tasks_book = (previous + match.group(4))[:-1]
+        task = match.group(5)
     else:
-        data['id_tasks_book'] = (match.group(1) + match.group(2))[:-1]
-        data['task'] = match.group(3)
+        id_tasks_book = (match.group(1) + match.group(2))[:-1]
+        task = match.group(3)
+
+    tasks_data['id_tasks_book'].append(id_tasks_book)
+    tasks_data['task'].append(task)
+    tasks_data['answer'].append(None)
+    tasks_data['classes'].append(classes)
+    tasks_data['paragraph'].append(paragraph)
+    tasks_data['topic_id'].append(topic_id)
+    tasks_data['level'].append(level)
 
-    return data
 
+def get_answers(text):
+    """Извлекает ответы и части ответов ко всем задачам за один проход.
 
-def get_answer_text(task_id, text):
-    """Извлекает текст ответа для задачи.
+    Если номер задачи или подзадачи встречается несколько раз,
+    сохраняется первое вхождение. Части ответа ищутся с перекрытием,
+    как при отдельном поиске каждого ID подзадачи.
 
     Args:
-        task_id (str): ID задачи.
-        text (str): Текст для поиска ответа.
+        text (str): Текст раздела с ответами.
 
     Returns:
-        str: Текст ответа или ABSENT, если ответ не найден.
+        tuple: (словарь {номер задачи: ответ},
+            словарь {(номер задачи, ID подзадачи): часть ответа})
     """
-    pattern = fr'{task_id}' + RE_ANSWER_TEXT
-    answer_match = re.search(pattern, text)
-    if answer_match:
-        return answer_match.group(1).strip()
-    return ABSENT
+    answers = {}
+    answer_parts = {}
+    for answer_match in RE_ANY_ANSWER_C.finditer(text):
+        task_num = int(answer_match.group(1))
+        if task_num in answers:
+            continue
+        answer = answer_match.group(2).strip()
+        answers[task_num] = answer
+        for part_match in RE_ANY_PART_ANSWER_C.finditer(answer):
+            answer_parts.setdefault((task_num, part_match.group(1)),
+                                    part_match.group(2).strip())
+    return answers, answer_parts
 
 
-def get_answer_part(task_part_id, text):
-    """Извлекает часть ответа для подзадачи.
+def get_task_ids(tasks_data):
+    """Разбирает ID задач на номер задачи и ID подзадачи.
 
     Args:
-        task_part_id (str): ID подзадачи.
-        text (str): Текст для поиска ответа.
+        tasks_data (dict): Столбцы с данными о задачах.
 
     Returns:
-        str: Текст части ответа или ABSENT, если ответ не найден.
+        list: Список кортежей (номер задачи, ID подзадачи или None).
     """
-    pattern = fr'{task_part_id}' + RE_PART_ANSWER
-    answer_part_match = re.search(pattern, text)
-    if answer_part_match:
-        return answer_part_match.group(1)[:answer_part_match.end()].strip()
-    return ABSENT
+    task_ids = []
+    for id_tasks_book in tasks_data['id_tasks_book']:
+        task_id_match = RE_TASK_ID_C.search(id_tasks_book)
+        if task_id_match.group(1):
+            task_ids.append((int(task_id_match.group(1)),
+                             task_id_match.group(2)))
+        else:
+            task_ids.append((int(task_id_match.group()), None))
+    return task_ids
 
 
 def answer_parser(data, tasks_data):
@@ -168,201 +280,180 @@ def answer_parser(data, tasks_data):
 
     Args:
         data (list): Список текстовых параграфов с ответами.
-        tasks_data (list): Список данных о задачах.
+        tasks_data (dict): Столбцы с данными о задачах.
 
     Returns:
-        list: Обновленный список задач с добавленными ответами.
+        dict: Столбцы задач с заполненными ответами.
     """
+    answers, answer_parts = get_answers(str.join('\n', data))
+    task_ids = get_task_ids(tasks_data)
+    answer_column = tasks_data['answer']
+    tasks_len = len(task_ids)
+
+    def assign(index, task_num, part_id):
+        """Записывает ответ или часть ответа для задачи с индексом index."""
+        if part_id is None:
+            answer_column[index] = answers.get(task_num, ABSENT)
+        else:
+            answer_column[index] = answer_parts.get(
+                (task_num, part_id), ABSENT)
+
     index = 0
-    answers_text = str.join('\n', data)
     current_task_num = 0
-    while index < len(tasks_data[:]):
-        task = tasks_data[index]
-        task_id_match = re.search(RE_TASK_ID, task['id_tasks_book'])
-        if task_id_match.group(1):
-            if int(task_id_match.group(1)) >= current_task_num:
-                current_task_num = int(task_id_match.group(1))
-                answer = get_answer_text(current_task_num, answers_text)
-                if answer != ABSENT:
-                    answer_part = get_answer_part(task_id_match.group(2),
-                                                  answer)
-                    tasks_data[index]['answer'] = answer_part
-                else:
-                    tasks_data[index]['answer'] = answer
+    while index < tasks_len:
+        task_num, part_id = task_ids[index]
+        if part_id is not None:
+            if task_num >= current_task_num:
+                current_task_num = task_num
+                assign(index, task_num, part_id)
+            index += 1
+            continue
 
+        current_task_num = task_num
+        if index + 1 == tasks_len:
+            assign(index, task_num, None)
+            break
+        next_task_num, next_part_id = task_ids[index + 1]
+        if next_part_id is None:
+            cmp = 1
         else:
-            current_task_num = int(task_id_match.group())
-            next_task = tasks_data[index + 1]
-            next_task_id_match = re.search(RE_TASK_ID,
-                                           next_task['id_tasks_book'])
-            if next_task_id_match.group(1) is None:
-                answer = get_answer_text(current_task_num, answers_text)
-                tasks_data[index]['answer'] = answer
-                current_task_num = int(next_task_id_match.group())
-                next_answer = get_answer_text(current_task_num, answers_text)
-                tasks_data[index + 1]['answer'] = next_answer
-                index += 1
-            elif int(next_task_id_match.group(1)) > current_task_num:
-                answer = get_answer_text(current_task_num, answers_text)
-                tasks_data[index]['answer'] = answer
-                current_task_num = int(next_task_id_match.group(1))
-                next_answer = get_answer_text(current_task_num, answers_text)
-                if next_answer != ABSENT:
-                    next_answer_part = get_answer_part(
-                        next_task_id_match.group(2),
-                        next_answer)
-                    tasks_data[index + 1]['answer'] = next_answer_part
-                else:
-                    tasks_data[index + 1]['answer'] = next_answer
-                index += 1
-            elif int(next_task_id_match.group(1)) == current_task_num:
-                tasks_data[index]['answer'] = ABSENT
-                next_answer = get_answer_text(current_task_num, answers_text)
-                if next_answer != ABSENT:
-                    next_answer_part = get_answer_part(
-                        next_task_id_match.group(2), next_answer)
-                    tasks_data[index + 1]['answer'] = next_answer_part
-                index + 1
+            cmp = (next_task_num > task_num) - (next_task_num < task_num)
+        if cmp > 0:
+            assign(index, task_num, None)
+        elif cmp == 0:
+            answer_column[index] = ABSENT
+        if cmp >= 0:
+            current_task_num = next_task_num
+            assign(index + 1, next_task_num, next_part_id)
+            index += 1
         index += 1
     return tasks_data
 
 
-def parser(doc):
+def parser(docx_file):
     """Основная функция парсинга документа.
 
     Args:
-        doc (Document): Объект документа Word.
+        docx_file (str | file): Путь к .docx-файлу или открытый файл.
 
     Returns:
-        tuple: Кортеж с тремя списками:
-            - Данные о задачах
-            - Данные о главах
-            - Данные об авторе
+        tuple: Кортеж с тремя элементами:
+            - Столбцы с данными о задачах
+            - Столбцы с данными о главах
+            - Список с данными об авторе
     """
-    chapters_data = []
-    tasks_data = []
+    chapters_data = new_table(CHAPTERS_COLUMNS)
+    tasks_data = new_table(TASKS_COLUMNS)
     answers_text = []
-    authors_data = [{
-        'name': 'Текстовые задачи по математике. 5–6 классы / ' +
-        'А. В. Шевкин. — 3-е изд., перераб. — М. : '
-        'Илекса, 2024. — 160 с. : ил.',
-        'description': 'Сборник включает текстовые задачи по разделам '
-        'школьной математики: натуральные числа, дроби, пропорции, '
-        'проценты, уравнения. Ко многим задачам даны ответы или советы с '
-        'чего начать решения. Решения некоторых задач приведены в качестве '
-        'образцов в основном тексте книги или в разделе '
-        '«Ответы, советы, решения». '
-        'Материалы сборника можно использовать как '
-        'дополнение к любому действующему '
-        'учебнику. При подготовке этого издания добавлены новые '
-        'задачи и решения некоторых '
-        'задач. Пособие предназначено для учащихся 5–6 классов '
-        'общеобразовательных школ, учителей, '
-        'студентов педагогических вузов.',
-        'topic_id': 1,
-        'classes': '5;6'
-    }]
-
-    data = []
+
+    paragraphs = read_paragraphs(docx_file)
+    window = deque(islice(paragraphs, 2), maxlen=2)
     index = 0
     current_chapter = 0
     supreme_chapter_id = 0
     current_id = 1
-    for item in doc.iter_inner_content():
-        data.append(item.text.strip())
-    while index < len(data):
-        text = data[index]
-        supreme_chapter_match = re.search(RE_SUPREME_CHAPTER, text)
-        if supreme_chapter_match:
+    current_paragraph_id = 0
+    while window:
+        text = window[0]
+        kind = get_paragraph_kind(text)
+        if kind == 'supreme':
+            supreme_chapter_match = RE_SUPREME_CHAPTER_C.search(text)
             its_next_chapter = int(
                 supreme_chapter_match.group(1)[:-1]) == current_chapter + 1
-            task_match = re.search(RE_TASK, text)
+            task_match = RE_TASK_C.search(text)
             if its_next_chapter and task_match is None:
-                chapter_match, chapter_index = find_next_chapter(
-                    data, index + 1)
+                chapter_match = (
+                    RE_CHAPTER_C.search(window[1])
+                    if len(window) > 1 else None)
                 if chapter_match:
-                    chapters_data.append(get_chapter_data(
-                        current_id,
-                        supreme_chapter_match))
+                    append_chapter(chapters_data, current_id,
+                                   supreme_chapter_match)
                     supreme_chapter_id = current_id
                     current_id += 1
 
-                    chapters_data.append(get_chapter_data(current_id,
-                                                          chapter_match,
-                                                          supreme_chapter_id))
+                    append_chapter(chapters_data, current_id,
+                                   chapter_match, supreme_chapter_id)
                     current_id += 1
+                    current_paragraph_id = current_id - 1
 
                     current_chapter = int(supreme_chapter_match.group(1)[:-1])
-                    index = chapter_index + 1
+                    next_paragraph(window, paragraphs)
+                    next_paragraph(window, paragraphs)
+                    index += 2
                 else:
-                    chapters_data.append(get_chapter_data(
-                        current_id,
-                        supreme_chapter_match))
+                    append_chapter(chapters_data, current_id,
+                                   supreme_chapter_match)
                     supreme_chapter_id = current_id
                     current_id += 1
+                    current_paragraph_id = current_id - 1
 
                     current_chapter = int(supreme_chapter_match.group(1)[:-1])
+                    next_paragraph(window, paragraphs)
                     index += 1
                 continue
             else:
-                chapter_match = re.search(RE_CHAPTER, text)
+                chapter_match = RE_CHAPTER_C.search(text)
                 if chapter_match:
-                    chapters_data.append(get_chapter_data(current_id,
-                                                          chapter_match,
-                                                          supreme_chapter_id))
+                    append_chapter(chapters_data, current_id,
+                                   chapter_match, supreme_chapter_id)
                     current_id += 1
+                    current_paragraph_id = current_id - 1
 
+                    next_paragraph(window, paragraphs)
                     index += 1
                     continue
-                paragraph = chapters_data[-1]['id']
                 if task_match:
                     previous_id = (
-                        tasks_data[-1]['id_tasks_book'] if (
+                        tasks_data['id_tasks_book'][-1] if (
                             task_match.group(4)) else task_match.group(1))
-                    tasks_data.append(get_task_data(
-                        task_match, paragraph, previous_id))
-                    index = find_next_task(data, tasks_data, index + 1,
-                                           task_match.group(1),
-                                           paragraph=paragraph)
+                    append_task(tasks_data, task_match,
+                                current_paragraph_id, previous_id)
+                    next_paragraph(window, paragraphs)
+                    index = find_next_task(window, paragraphs, tasks_data,
+                                           index + 1, task_match.group(1),
+                                           paragraph=current_paragraph_id)
                 else:
-                    tasks_data.append(get_task_data(supreme_chapter_match,
-                                                    paragraph,
-                                                    exclusive=True))
+                    append_task(tasks_data, supreme_chapter_match,
+                                current_paragraph_id, exclusive=True)
+                    next_paragraph(window, paragraphs)
                     index += 1
             continue
-        chapter_match = re.search(RE_CHAPTER, text)
-        if chapter_match:
-            chapters_data.append(get_chapter_data(current_id,
-                                                  chapter_match,
-                                                  supreme_chapter_id))
+        if kind == 'chapter':
+            chapter_match = RE_CHAPTER_C.search(text)
+            append_chapter(chapters_data, current_id,
+                           chapter_match, supreme_chapter_id)
             current_id += 1
+            current_paragraph_id = current_id - 1
 
+            next_paragraph(window, paragraphs)
             index += 1
             continue
-        task_match = re.search(RE_TASK, text)
-        if task_match:
+        if kind == 'task':
+            task_match = RE_TASK_C.search(text)
             previous_id = (
-                tasks_data[-1]['id_tasks_book'] if (
+                tasks_data['id_tasks_book'][-1] if (
                     task_match.group(4)) else task_match.group(1))
-            paragraph = chapters_data[-1]['id']
-            tasks_data.append(get_task_data(
-                task_match, paragraph, previous_id))
-            index = find_next_task(
-                data, tasks_data, index + 1,  previous_id, paragraph)
+            append_task(tasks_data, task_match,
+                        current_paragraph_id, previous_id)
+            next_paragraph(window, paragraphs)
+            index = find_next_task(window, paragraphs, tasks_data,
+                                   index + 1, previous_id,
+                                   current_paragraph_id)
         elif text == 'Ответы и советы':
-            index += 1
-            while index < len(data[:]):
-                text = data[index]
+            next_paragraph(window, paragraphs)
+            while window:
+                text = window[0]
                 if text.lower().strip() == 'оглавление':
                     break
                 answers_text.append(text)
-                index += 1
+                next_paragraph(window, paragraphs)
             break
         else:
             raise ValueError(f'index:{index}    {text}')
 
     if answers_text != []:
         tasks_data = answer_parser(answers_text, tasks_data)
+    authors_data = [dict(author) for author in AUTHORS_DATA]
     return tasks_data, chapters_data, authors_data
 
 
@@ -370,21 +461,17 @@ if __name__ == '__main__':
     docx_path = input('Укажите путь к .docx-файду:\n')
     excel_path = input('Введите название для excel файла:\n')
 
-    document = docx.Document(docx_path)
-    tasks_data, chapters_data, authors_data = parser(document)
+    tasks_data, chapters_data, authors_data = parser(docx_path)
 
-    tasks_columns_order = [
-        'id_tasks_book', 'task', 'answer', 'classes',
-        'paragraph', 'topic_id', 'level'
-    ]
     author_columns_order = ['author', 'description', 'topic_id', 'classes']
 
-    chapters_columns_order = ['id', 'name', 'parent']
-
-    tasks_df = pandas.DataFrame(tasks_data, columns=tasks_columns_order)
-    authors_df = pandas.DataFrame(authors_data, columns=author_columns_order)
+    tasks_df = pandas.DataFrame(
+        tasks_data, columns=TASKS_COLUMNS, copy=False).astype(TASKS_DTYPES)
+    authors_df = pandas.DataFrame.from_records(
+        authors_data, columns=author_columns_order)
     chapters_df = pandas.DataFrame(
-        chapters_data, columns=chapters_columns_order)
+        chapters_data, columns=CHAPTERS_COLUMNS, copy=False).astype(
+            CHAPTERS_DTYPES)
     with pandas.ExcelWriter(excel_path, engine='openpyxl') as writer:
         tasks_df.to_excel(writer, sheet_name='tasks', index=False)
         authors_df.to_excel(writer, sheet_name='author', index=False)